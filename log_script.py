@@ -1,8 +1,11 @@
+import functools
+import hashlib
+import json
+import locale
 import os
+import shutil
 from datetime import datetime, date
-import subprocess
 import click
-import yaml
 from pathlib import Path
 import sys
 
@@ -21,6 +24,9 @@ DEFAULT_CONFIG = {
     "git_auto_commit": False,
 }
 
+# Parsed config keyed by path, invalidated when the file's mtime or size changes
+_CONFIG_CACHE = {}
+
 
 class WorkLogError(Exception):
     """Custom exception for work log errors."""
@@ -31,24 +37,77 @@ class WorkLogError(Exception):
 def load_config():
     """Load configuration from YAML file."""
     config_path = Path(get_git_root()) / CONFIG_FILE
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         return DEFAULT_CONFIG
+    stamp = [stat.st_mtime_ns, stat.st_size]
 
-    with open(config_path) as f:
-        return {**DEFAULT_CONFIG, **yaml.safe_load(f)}
-
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
+    # A JSON copy of the parsed YAML is much cheaper to load; trust it only
+    # while the YAML still has the mtime and size it was generated from
+    json_path = _config_cache_path(config_path)
+    try:
+        sidecar = json.loads(json_path.read_bytes())
+        parsed = sidecar["config"] if sidecar["stamp"] == stamp else None
+    except (OSError, ValueError, KeyError, TypeError):
+        parsed = None
+
+    if parsed is None:
+        import yaml
+
+        # Prefer the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(config_path) as f:
+            parsed = yaml.load(f, Loader=loader) or {}
+        try:
+            serialized = json.dumps({"stamp": stamp, "config": parsed})
+            # Skip configs JSON can't hold exactly (e.g. int keys, dates)
+            if json.loads(serialized)["config"] == parsed:
+                json_path.parent.mkdir(parents=True, exist_ok=True)
+                json_path.write_text(serialized)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    config = {**DEFAULT_CONFIG, **parsed}
+    _CONFIG_CACHE[config_path] = (stamp, config)
+    return config
+
+
+def _config_cache_path(config_path: Path):
+    """Location of the JSON cache for `config_path` in the user cache dir."""
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser()
+    key = hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()
+    return cache_dir / "worklog" / f"{key}.json"
+
+
+@functools.lru_cache(maxsize=1)
 def get_git_root():
     """Get the root directory of the git repository."""
+    # Look for .git (a directory, or a file for worktrees) without forking git
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        if (directory / ".git").exists():
+            return str(directory)
+
+    # Defer to git for layouts the walk can't see (e.g. GIT_DIR overrides)
+    import subprocess
+
     try:
         git_root = subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"], stderr=subprocess.DEVNULL
+            ["git", "rev-parse", "--show-toplevel"],
+            stderr=subprocess.DEVNULL,
+            text=True,
         )
-        return git_root.decode("utf-8").strip()
+        return git_root.strip()
     except subprocess.CalledProcessError:
         return os.getcwd()
 
 
+@functools.lru_cache(maxsize=1)
 def create_log_directory():
     """Create the logs directory if it doesn't exist."""
     git_root = get_git_root()
@@ -57,11 +116,10 @@ def create_log_directory():
     return log_dir
 
 
-def get_log_file_path():
-    """Generate the log file path for the current month."""
-    now = datetime.now()
+def get_log_file_path(date: datetime):
+    """Generate the log file path for the month of `date`."""
     log_dir = create_log_directory()
-    return os.path.join(log_dir, f"{now.strftime('%Y_%m')}.md")
+    return os.path.join(log_dir, f"{date.strftime('%Y_%m')}.md")
 
 
 def create_daily_entry(date: datetime):
@@ -70,90 +128,81 @@ def create_daily_entry(date: datetime):
 
     categories = load_config()["categories"]
 
-    click.echo("\nDaily Work Log Entry")
-    click.echo("===================")
+    # Collect the whole day in one editor session instead of prompting per line
+    template = "# Lines starting with '#', other than '### Category', are ignored\n\n"
+    template += "".join(f"### {category}\n* \n\n" for category in categories)
+    text = click.edit(template, extension=".md")
+    if text is None:
+        raise WorkLogError("Entry aborted: editor closed without saving")
 
-    entries = {}
-    for category in categories:
-        click.echo(f"\n{category}:")
-        click.echo("(Enter items, press Enter twice to move to next category)")
-        click.echo("(After each item, you'll be prompted for sub-items)")
-
-        items = []
-        while True:
-            item = click.prompt(">", type=str, default="", show_default=False).strip()
-            if not item:
-                if not items:  # If no items were entered
-                    break
-                if items and not items[-1]:  # If last item was empty
-                    items.pop()  # Remove the empty item
-                    break
-                items.append(item)
-            else:
-                # Collect sub-items for this item
-                sub_items = []
-                click.echo("  Enter sub-items (press Enter twice to finish):")
-                while True:
-                    sub_item = click.prompt(
-                        "  >", type=str, default="", show_default=False
-                    ).strip()
-                    if not sub_item:
-                        if (
-                            sub_items and not sub_items[-1]
-                        ):  # If last sub-item was empty
-                            sub_items.pop()  # Remove the empty sub-item
-                            break
-                        if not sub_items:  # If no sub-items were entered
-                            break
-                        sub_items.append(sub_item)
-                    else:
-                        sub_items.append(sub_item)
-
-                items.append((item, sub_items))
-
-        if items:
-            entries[category] = items
+    default_category = (categories or DEFAULT_CONFIG["categories"])[0]
+    entries = _parse_entry(text, default_category)
 
     # Format the entry
-    entry_text = f"\n{date_header}\n\n"
-    for category, items in entries.items():
-        if items:
-            entry_text += f"### {category}\n"
-            for item in items:
-                if isinstance(item, tuple):  # Item with sub-items
-                    main_item, sub_items = item
-                    entry_text += f"* {main_item}\n"
-                    for sub_item in sub_items:
-                        entry_text += f"    * {sub_item}\n"
-                else:  # Simple item without sub-items
-                    entry_text += f"* {item}\n"
-            entry_text += "\n"
-
-    return entry_text
-
-
-def update_log_file(entry):
-    """Update the monthly log file with the new entry."""
-    file_path = get_log_file_path()
+    sections = "".join(
+        f"### {category}\n" + "".join(_format_item(item) for item in items) + "\n"
+        for category, items in entries.items()
+        if items
+    )
+    return f"\n{date_header}\n\n{sections}"
+
+
+def _parse_entry(text, default_category):
+    """Parse the edited template into {category: [(item, [sub_items])]}.
+
+    `### Name` starts a category and any other `#` line is a comment. Lines
+    before the first heading belong to `default_category`. Indented lines are
+    sub-items of the item above them, and a leading `*`, `-` or `+` is dropped.
+    """
+    entries = {}
+    items = entries.setdefault(default_category, [])
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            if stripped.startswith("### ") and stripped[4:].strip():
+                items = entries.setdefault(stripped[4:].strip(), [])
+            continue
+        if stripped[:2] in ("* ", "- ", "+ ") or stripped in ("*", "-", "+"):
+            stripped = stripped[1:].strip()
+        if not stripped:  # Blank lines and unfilled bullets from the template
+            continue
+        if line[:1].isspace() and items:
+            items[-1][1].append(stripped)
+        else:
+            items.append((stripped, []))
+    return entries
+
+
+def _format_item(item):
+    """Format a log item and its sub-items as markdown bullets."""
+    main_item, sub_items = item
+    return f"* {main_item}\n" + "".join(f"    * {sub}\n" for sub in sub_items)
 
-    # Create file with header if it doesn't exist
-    if not os.path.exists(file_path):
-        with open(file_path, "w") as f:
-            month_year = datetime.now().strftime("%B %Y")
-            f.write(f"# Work Log - {month_year}\n")
 
-    # Append the new entry
-    with open(file_path, "a") as f:
-        f.write(entry)
+def update_log_file(entry, date: datetime):
+    """Update the monthly log file with the new entry."""
+    file_path = get_log_file_path(date)
+
+    # Header and entry are written together, so the buffered writer flushes
+    # them in one go on close (retrying any short write)
+    with open(file_path, "ab") as f:
+        # An empty file is new this month and needs its header first
+        if f.tell() == 0:
+            month_year = date.strftime("%B %Y")
+            entry = f"# Work Log - {month_year}\n{entry}"
+        # Match the locale encoding text-mode open() uses when reading logs back
+        f.write(entry.encode(locale.getpreferredencoding(False)))
 
     return file_path
 
 
-def commit_to_git(file_path):
+def commit_to_git(file_path, date: datetime):
     """Commit the changes to git."""
+    import subprocess
+
     try:
         subprocess.run(["git", "add", file_path], check=True)
-        commit_message = f"Update work log for {datetime.now().strftime('%Y-%m-%d')}"
+        commit_message = f"Update work log for {date.strftime('%Y-%m-%d')}"
         subprocess.run(["git", "commit", "-m", commit_message], check=True)
         click.echo("Changes committed to git successfully!")
     except subprocess.CalledProcessError as e:
@@ -184,13 +233,14 @@ def log(git: bool, date: date):
     try:
         click.echo("Creating new work log entry...")
         entry = create_daily_entry(date)
-        file_path = update_log_file(entry)
+        # The same date drives the entry, file name and commit message
+        file_path = update_log_file(entry, date)
 
         click.echo(f"\nWork log updated successfully!")
         click.echo(f"File location: {file_path}")
 
         if git:
-            commit_to_git(file_path)
+            commit_to_git(file_path, date)
     except WorkLogError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -206,11 +256,14 @@ def log(git: bool, date: date):
 @click.option(
     "--date",
     type=click.DateTime(formats=["%Y-%m-%d"]),
-    default=lambda: datetime.now(),
-    help="View logs for specific date (YYYY-MM-DD)",
+    default=None,
+    help="View logs for specific date (YYYY-MM-DD, default: today)",
 )
 def view(month, date):
     """View work log entries."""
+    # Show today's entry unless a month or a date was asked for
+    if date is None and month is None:
+        date = datetime.now()
 
     try:
         if date:
@@ -218,28 +271,30 @@ def view(month, date):
             file_path = os.path.join(
                 create_log_directory(), f"{date.strftime('%Y_%m')}.md"
             )
-            if not os.path.exists(file_path):
+            try:
+                content = Path(file_path).read_text()
+            except FileNotFoundError:
                 raise WorkLogError("No logs found for specified date")
 
-            with open(file_path) as f:
-                content = f.read()
-                date_header = f"## {date.strftime('%Y-%m-%d')}"
-                sections = content.split("\n## ")
-                for section in sections:
-                    if section.startswith(date.strftime("%Y-%m-%d")):
-                        click.echo(f"## {section}")
-                        return
+            # Slice out the day's section rather than splitting every section
+            start = content.find(f"\n## {date.strftime('%Y-%m-%d')}")
+            if start < 0:
                 raise WorkLogError(f"No entry found for {date.strftime('%Y-%m-%d')}")
+            end = content.find("\n## ", start + 1)
+            click.echo(content[start + 1 : end if end >= 0 else None])
         else:
             # View entire month
             file_path = os.path.join(
                 create_log_directory(), f"{month.strftime('%Y_%m')}.md"
             )
-            if not os.path.exists(file_path):
+            try:
+                f = open(file_path, "rb")
+            except FileNotFoundError:
                 raise WorkLogError("No logs found for specified month")
 
-            with open(file_path) as f:
-                click.echo(f.read())
+            # Copy the raw bytes through instead of decoding and re-encoding
+            with f:
+                shutil.copyfileobj(f, sys.stdout.buffer)
 
     except WorkLogError as e:
         click.echo(f"Error: {e}", err=True)
@@ -254,8 +309,15 @@ def init():
         if not click.confirm("Configuration file exists. Overwrite?"):
             return
 
-    with open(config_path, "w") as f:
-        yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False)
+    import yaml
+
+    config_path.write_text(
+        yaml.dump(
+            DEFAULT_CONFIG,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False,
+        )
+    )
     click.echo(f"Configuration file created at {config_path}")
 
 